@@ -99,6 +99,12 @@ class CallbackImplProxyMethod(typehandlers.ReverseWrapperBase):
     def generate_python_call(self):
         """code to call the python method"""
         build_params = self.build_params.get_parameters(force_tuple_creation=True)
+        if build_params == ['"()"']:
+            ## no arguments: call without building an argument tuple
+            self.before_call.write_code('py_retval = PyObject_CallObject(m_callback, NULL);')
+            self.before_call.write_error_check('py_retval == NULL')
+            self.before_call.add_cleanup_code('Py_DECREF(py_retval);')
+            return
         if build_params[0][0] == '"':
             build_params[0] = '(char *) ' + build_params[0]
         args = self.before_call.declare_variable('PyObject*', 'args')
@@ -112,9 +118,62 @@ class CallbackImplProxyMethod(typehandlers.ReverseWrapperBase):
 
 
 
+def callback_template_parameters(template_parameters):
+    """
+    Pad a callbacks_list row up to the 10 template parameters of
+    ns3::Callback; rows may be stored with only the used parameters.
+    Unused parameters, including 'ns3::empty' ones, become None.
+    """
+    template_parameters = [None if arg == 'ns3::empty' else arg for arg in template_parameters]
+    if len(template_parameters) > 10:
+        raise ValueError("ns3::Callback takes at most 10 template parameters, got %r"
+                         % (template_parameters,))
+    return template_parameters + [None] * (10 - len(template_parameters))
+
+
+def callback_template_arguments(template_parameters):
+    "C++ template argument list for padded callback template parameters"
+    return ', '.join('ns3::empty' if arg is None else arg for arg in template_parameters)
+
+
+def write_callback_classes(callback_classes_file, callbacks):
+    """
+    Write a module's callbacks_list.py.  Each distinct type name is
+    written once, in type_names, and every row is spelled as a tuple of
+    indices into it, without the trailing ns3::empty padding; the file
+    rebuilds callback_classes from those rows.
+    """
+    type_ids = {}
+    callback_classes_ids = []
+    for template_parameters in callbacks:
+        template_parameters = list(template_parameters)
+        while template_parameters[-1] == 'ns3::empty':
+            template_parameters.pop()
+        callback_classes_ids.append(tuple(type_ids.setdefault(type_name, len(type_ids))
+                                          for type_name in template_parameters))
+
+    callback_classes_file.write("## every distinct C++ type name used by the rows below; a type ID is an index\n"
+                                "## into this tuple\n")
+    callback_classes_file.write("type_names = (\n")
+    for type_name, type_id in type_ids.items():
+        callback_classes_file.write("    %r,  # %d\n" % (type_name, type_id))
+    callback_classes_file.write(")\n\n")
+    callback_classes_file.write("## (return type, argument types...) rows spelled as type IDs; the ns3::empty\n"
+                                "## padding up to the 10 ns3::Callback template parameters is added back by the\n"
+                                "## bindings generator\n")
+    callback_classes_file.write("callback_classes_ids = (\n")
+    for type_ids_row in callback_classes_ids:
+        callback_classes_file.write("    %r,\n" % (type_ids_row,))
+    callback_classes_file.write(")\n\n\n")
+    callback_classes_file.write("callback_classes = tuple(tuple(type_names[type_id] for type_id in type_ids)\n"
+                                "                         for type_ids in callback_classes_ids)\n")
+
+
 def register_callback_classes(out, callbacks):
     for callback_impl_num, template_parameters in enumerate(callbacks):
-        cls_name = "ns3::Callback< %s >" % ', '.join(template_parameters)
+        template_arguments = callback_template_arguments(
+            callback_template_parameters(template_parameters))
+        cls_name = "ns3::Callback< %s >" % template_arguments
         #print >> sys.stderr, "***** trying to register callback: %r" % cls_name
         class_name = "PythonCallbackImpl%i" % callback_impl_num
 
@@ -124,7 +183,7 @@ def register_callback_classes(out, callbacks):
             print("***** registering callback handler: %r (%r)" % (ctypeparser.normalize_type_string(cls_name), cls_name), file=sys.stderr)
             DIRECTIONS = [Parameter.DIRECTION_IN]
             PYTHON_CALLBACK_IMPL_NAME = class_name
-            TEMPLATE_ARGS = template_parameters
+            TEMPLATE_ARGS = template_arguments
             DISABLED = False
 
             def convert_python_to_c(self, wrapper):
@@ -146,12 +205,12 @@ def register_callback_classes(out, callbacks):
                     wrapper.before_call.write_code("%s = ns3::Create<%s> (%s);"
                                                    % (callback_impl, self.PYTHON_CALLBACK_IMPL_NAME, py_callback))
                     wrapper.call_params.append(
-                        'ns3::Callback<%s> (%s)' % (', '.join(self.TEMPLATE_ARGS), callback_impl))
+                        'ns3::Callback<%s> (%s)' % (self.TEMPLATE_ARGS, callback_impl))
                 else:
                     py_callback = wrapper.declarations.declare_variable('PyObject*', self.name, 'NULL')
                     wrapper.parse_params.add_parameter('O', ['&'+py_callback], self.name, optional=True)
                     value = wrapper.declarations.declare_variable(
-                        'ns3::Callback<%s>' % ', '.join(self.TEMPLATE_ARGS),
+                        'ns3::Callback<%s>' % self.TEMPLATE_ARGS,
                         self.name+'_value',
                         self.default_value)
 
@@ -163,7 +222,7 @@ def register_callback_classes(out, callbacks):
                         'PyErr_SetString(PyExc_TypeError, "parameter \'%s\' must be callbale");' % self.name)
 
                     wrapper.before_call.write_code("%s = ns3::Callback<%s> (ns3::Create<%s> (%s));"
-                                                   % (value, ', '.join(self.TEMPLATE_ARGS),
+                                                   % (value, self.TEMPLATE_ARGS,
                                                       self.PYTHON_CALLBACK_IMPL_NAME, py_callback))
 
                     wrapper.before_call.unindent()
@@ -177,11 +236,34 @@ def register_callback_classes(out, callbacks):
                                                      "(python using callbacks defined in C++) not implemented.")
 
 
+## type string -> (type without toplevel modifiers, keyword arguments)
+_callback_ctype_cache = {}
+
+def _parse_callback_ctype(type_string):
+    """
+    Parse a callback return or parameter type once per distinct type
+    string; the same types recur across most callback signatures.
+    """
+    try:
+        return _callback_ctype_cache[type_string]
+    except KeyError:
+        pass
+    ctype = ctypeparser.parse_type(type_string)
+    if ('const' in ctype.remove_modifiers()):
+        kwargs = {'is_const': True}
+    else:
+        kwargs = {}
+    result = _callback_ctype_cache[type_string] = (str(ctype), kwargs)
+    return result
+
+
 def generate_callback_classes(module, callbacks):
     out = module.after_forward_declarations
     for callback_impl_num, template_parameters in enumerate(callbacks):
+        template_parameters = callback_template_parameters(template_parameters)
+        template_arguments = callback_template_arguments(template_parameters)
         sink = MemoryCodeSink()
-        cls_name = "ns3::Callback< %s >" % ', '.join(template_parameters)
+        cls_name = "ns3::Callback< %s >" % template_arguments
         #print >> sys.stderr, "***** trying to register callback: %r" % cls_name
         class_name = "PythonCallbackImpl%i" % callback_impl_num
         sink.writeln('''
@@ -212,16 +294,12 @@ public:
             return false;
     }
 
-''' % (class_name, ', '.join(template_parameters), class_name, class_name, class_name, class_name))
+''' % (class_name, template_arguments, class_name, class_name, class_name, class_name))
         sink.indent()
         callback_return = template_parameters[0]
-        return_ctype = ctypeparser.parse_type(callback_return)
-        if ('const' in return_ctype.remove_modifiers()):
-            kwargs = {'is_const': True}
-        else:
-            kwargs = {}
+        return_ctype, kwargs = _parse_callback_ctype(callback_return)
         try:
-            return_type = ReturnValue.new(str(return_ctype), **kwargs)
+            return_type = ReturnValue.new(return_ctype, **kwargs)
         except (typehandlers.TypeLookupError, typehandlers.TypeConfigurationError) as ex:
             warnings.warn("***** Unable to register callback; Return value '%s' error (used in %s): %r"
                           % (callback_return, cls_name, ex),
@@ -230,17 +308,17 @@ public:
 
         arguments = []
         ok = True
-        callback_parameters = [arg for arg in template_parameters[1:] if arg != 'ns3::empty']
+        callback_parameters = []
+        for arg in template_parameters[1:]:
+            if arg is None:
+                break
+            callback_parameters.append(arg)
         for arg_num, arg_type in enumerate(callback_parameters):
             arg_name = 'arg%i' % (arg_num+1)
 
-            param_ctype = ctypeparser.parse_type(arg_type)
-            if ('const' in param_ctype.remove_modifiers()):
-                kwargs = {'is_const': True}
-            else:
-                kwargs = {}
+            param_ctype, kwargs = _parse_callback_ctype(arg_type)
             try:
-                param = Parameter.new(str(param_ctype), arg_name, **kwargs)
+                param = Parameter.new(param_ctype, arg_name, **kwargs)
                 cpp_class = getattr(param, "cpp_class", None)
                 if isinstance(cpp_class, cppclass.CppClass):
                     # check if the "helper class" can be constructed
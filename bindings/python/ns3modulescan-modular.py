@@ -215,15 +215,15 @@ class PreScanHook:
 
 
 def scan_callback_classes(module_parser, callback_classes_file):
-    callback_classes_file.write("callback_classes = [\n")
+    callbacks = []
     for cls in module_parser.module_namespace.classes(function=module_parser.location_filter,
                                                       recursive=False):
         if not cls.name.startswith("Callback<"):
             continue
         assert templates.is_instantiation(cls.decl_string), "%s is not a template instantiation" % cls
         dummy_cls_name, template_parameters = templates.split(cls.decl_string)
-        callback_classes_file.write("    %r,\n" % template_parameters)
-    callback_classes_file.write("]\n")
+        callbacks.append(template_parameters)
+    ns3modulegen_core_customizations.write_callback_classes(callback_classes_file, callbacks)
 
 
 def ns3_module_scan(top_builddir, module_name, headers_map, output_file_name, cflags):